@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import functools
 import json
 import re
 import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 try:
     import openpyxl
@@ -14,6 +15,18 @@ except Exception:  # pragma: no cover - optional for self-test
 
 
 DAYS_ORDER = ["월", "화", "수", "목", "금"]
+DAYS_IDX: Dict[str, int] = {day: idx for idx, day in enumerate(DAYS_ORDER)}
+_NUM_DAYS = len(DAYS_ORDER)
+NO_CLASS = -1
+# 교시 비트 마스크: bit (p - 1)이 켜져 있으면 p교시에 수업이 있다.
+PERIOD7_BIT = 1 << 6
+# 1~7교시 밖의 대상 교시는 어떤 요일 마스크로도 만족할 수 없도록 이 비트로 표시한다.
+_UNREACHABLE_BIT = 1 << 7
+# A열이 이만큼 연속으로 비어 있으면 교사 목록이 끝난 것으로 보고 읽기를 멈춘다.
+_MAX_BLANK_ROWS = 20
+
+_PAREN_SUFFIX_RE = re.compile(r"\s*\([^)]*\)\s*$")
+_CR_TO_LF = str.maketrans({"\r": "\n"})
 
 
 class ParseError(Exception):
@@ -26,28 +39,43 @@ class DayBlock:
     start_col: int
 
 
-def load_sheet(path: str):
+@dataclass
+class Timetable:
+    teachers: List[str]
+    # codes[교사 번호][요일 번호][교시 - 1] = 학급 번호(class_codes의 인덱스) 또는 NO_CLASS
+    codes: List[List[List[int]]]
+    class_codes: List[str]
+    # day_masks[교사 번호][요일 번호] = 수업이 있는 교시의 비트 마스크
+    day_masks: List[List[int]]
+
+
+def load_sheet(path: str, read_only: bool = True):
     if openpyxl is None:
         raise ParseError("openpyxl을 불러올 수 없습니다. requirements.txt를 설치하세요.")
     try:
-        wb = openpyxl.load_workbook(path, data_only=True)
+        wb = openpyxl.load_workbook(path, data_only=True, read_only=read_only)
     except Exception as exc:
         raise ParseError(f"엑셀 파일을 열 수 없습니다: {exc}") from exc
 
     if "주간시간표" in wb.sheetnames:
-        return wb["주간시간표"]
-    if wb.sheetnames:
-        return wb[wb.sheetnames[0]]
-    raise ParseError("시트가 존재하지 않습니다.")
+        sheet = wb["주간시간표"]
+    elif wb.sheetnames:
+        sheet = wb[wb.sheetnames[0]]
+    else:
+        raise ParseError("시트가 존재하지 않습니다.")
+
+    # 일부 프로그램은 dimension을 A1로 잘못 기록한다. read-only 모드에서는
+    # 이 값으로 행을 잘라내므로, 크기 정보를 지우고 실제 데이터를 끝까지 읽는다.
+    if read_only and sheet.max_row == 1 and sheet.max_column == 1:
+        sheet.reset_dimensions()
+    return sheet
 
 
 def detect_day_blocks(sheet) -> List[DayBlock]:
     day_blocks: List[DayBlock] = []
     seen = set()
-    row = 2
-    max_col = getattr(sheet, "max_column", 0) or 0
-    for col in range(1, max_col + 1):
-        value = sheet.cell(row=row, column=col).value
+    header = next(sheet.iter_rows(min_row=2, max_row=2, values_only=True), ())
+    for col, value in enumerate(header, start=1):
         if isinstance(value, str):
             value = value.strip()
         if value in DAYS_ORDER and value not in seen:
@@ -61,14 +89,18 @@ def detect_day_blocks(sheet) -> List[DayBlock]:
 
 
 def normalize_teacher_name(raw_name: str) -> str:
-    name = raw_name.strip()
-    name = re.sub(r"\s*\([^)]*\)\s*$", "", name)
-    return name.strip()
+    return _PAREN_SUFFIX_RE.sub("", raw_name.strip()).strip()
 
 
 def normalize_cell_text(value: str) -> str:
-    text = value.replace("_x000D_\n", "\n")
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if "\r" not in value and "_x000D_" not in value:
+        return value
+    text = value
+    if "_x000D_" in text:
+        text = text.replace("_x000D_\n", "\n")
+    if "\r" in text:
+        # \r\n은 줄바꿈 하나로 합쳐야 하므로 먼저 치환하고, 남은 \r은 한 번에 바꾼다.
+        text = text.replace("\r\n", "\n").translate(_CR_TO_LF)
     return text
 
 
@@ -76,13 +108,17 @@ def parse_cell_to_class(value) -> Optional[str]:
     if not isinstance(value, str):
         return None
     text = normalize_cell_text(value)
-    first_line = text.split("\n", 1)[0]
-    match = re.match(r"^\s*(\d+)", first_line)
-    if not match:
-        return None
-    return match.group(1)
+    newline = text.find("\n")
+    first_line = (text if newline < 0 else text[:newline]).lstrip()
+    # 정규식의 \d와 같은 기준(isdecimal)으로 앞자리 숫자만 직접 훑는다.
+    end = 0
+    length = len(first_line)
+    while end < length and first_line[end].isdecimal():
+        end += 1
+    return first_line[:end] or None
 
 
+@functools.lru_cache(maxsize=512)
 def format_class_code(code: str) -> str:
     if len(code) == 3 and code.isdigit():
         grade = code[0]
@@ -91,123 +127,201 @@ def format_class_code(code: str) -> str:
     return f"({code})"
 
 
-def parse_teacher_rows(sheet, day_blocks: List[DayBlock]) -> Dict[str, Dict[str, Dict[int, Optional[str]]]]:
-    data: Dict[str, Dict[str, Dict[int, Optional[str]]]] = {}
-    max_row = getattr(sheet, "max_row", 0) or 0
-    for row in range(4, max_row + 1):
-        teacher_cell = sheet.cell(row=row, column=1).value
-        if teacher_cell is None:
-            continue
-        if isinstance(teacher_cell, str) and not teacher_cell.strip():
+def parse_teacher_rows(sheet, day_blocks: List[DayBlock]) -> Timetable:
+    timetable = Timetable(teachers=[], codes=[], class_codes=[], day_masks=[])
+    teacher_index: Dict[str, int] = {}
+    code_table: Dict[str, int] = {}
+    # (요일 번호, 교시 번호, 교시 비트, 0-기준 열 번호) 목록을 한 번만 계산해 두고 행마다 재사용한다.
+    slots = [
+        (DAYS_IDX[block.day], period - 1, 1 << (period - 1), block.start_col + period - 2)
+        for block in day_blocks
+        for period in range(1, 8)
+    ]
+    blank_run = 0
+    for row_values in sheet.iter_rows(min_row=4, values_only=True):
+        teacher_cell = row_values[0] if row_values else None
+        if teacher_cell is None or (isinstance(teacher_cell, str) and not teacher_cell.strip()):
+            blank_run += 1
+            if blank_run >= _MAX_BLANK_ROWS:
+                break
             continue
+        blank_run = 0
         teacher_name = normalize_teacher_name(str(teacher_cell))
         if not teacher_name:
             continue
 
-        if teacher_name not in data:
-            data[teacher_name] = {day: {p: None for p in range(1, 8)} for day in DAYS_ORDER}
+        idx_teacher = teacher_index.get(teacher_name)
+        if idx_teacher is None:
+            idx_teacher = len(timetable.teachers)
+            teacher_index[teacher_name] = idx_teacher
+            timetable.teachers.append(teacher_name)
+            timetable.codes.append([[NO_CLASS] * 7 for _ in DAYS_ORDER])
+            timetable.day_masks.append([0] * _NUM_DAYS)
+
+        week = timetable.codes[idx_teacher]
+        masks = timetable.day_masks[idx_teacher]
+        width = len(row_values)
+        for day_idx, period_idx, bit, idx in slots:
+            value = row_values[idx] if idx < width else None
+            class_code = parse_cell_to_class(value)
+            if class_code is None:
+                week[day_idx][period_idx] = NO_CLASS
+                masks[day_idx] &= ~bit
+            else:
+                week[day_idx][period_idx] = code_table.setdefault(class_code, len(code_table))
+                masks[day_idx] |= bit
+
+    timetable.class_codes = list(code_table)
+    return timetable
+
+
+@functools.lru_cache(maxsize=32)
+def _target_bits(target_periods: Tuple[int, ...]) -> int:
+    bits = 0
+    for p in target_periods:
+        bits |= 1 << (p - 1) if 1 <= p <= 7 else _UNREACHABLE_BIT
+    return bits
+
+
+def _empty_summary() -> Dict:
+    return {
+        "patternA": [],
+        "patternB": {"triggered": False, "days": []},
+        "patternC": {"triggered": False, "days": []},
+    }
+
+
+def _build_teacher_result(
+    teacher: str,
+    pattern_a: List[Tuple[str, int, str]],
+    pattern_b_days: Optional[List[str]],
+    pattern_c_days: Optional[List[str]],
+    consecutive_len: int,
+    target_periods: Sequence[int],
+    min_days: int,
+) -> Tuple[List[str], Dict]:
+    teacher_msgs: List[str] = []
+    teacher_summary = _empty_summary()
+
+    for day, start, class_code in pattern_a:
+        end = start + consecutive_len - 1
+        class_text = format_class_code(class_code)
+        teacher_msgs.append(
+            f"이 시간표는 {teacher} 선생님이 {day}요일에 {start}~{end}교시 연속 {class_text}입니다."
+        )
+        teacher_summary["patternA"].append(
+            {
+                "day": day,
+                "start": start,
+                "end": end,
+                "class_code": class_code,
+            }
+        )
 
-        for block in day_blocks:
-            for period in range(1, 8):
-                col = block.start_col + period - 1
-                value = sheet.cell(row=row, column=col).value
-                class_code = parse_cell_to_class(value)
-                data[teacher_name][block.day][period] = class_code
+    if pattern_b_days is not None:
+        days_text = ",".join(pattern_b_days)
+        periods_text = ",".join(str(p) for p in target_periods)
+        teacher_msgs.append(
+            f"이 시간표는 {teacher} 선생님이 {_NUM_DAYS}일 중 {min_days}일 이상 ({periods_text})교시에 수업이 있는 시간표입니다. (해당 요일: {days_text})"
+        )
+        teacher_summary["patternB"] = {"triggered": True, "days": pattern_b_days}
 
-    return data
+    if pattern_c_days is not None:
+        days_text = ",".join(pattern_c_days)
+        teacher_msgs.append(
+            f"이 시간표는 {teacher} 선생님이 {_NUM_DAYS}일 중 {min_days}일 이상 7교시에 수업이 있는 시간표입니다. (해당 요일: {days_text})"
+        )
+        teacher_summary["patternC"] = {"triggered": True, "days": pattern_c_days}
 
+    return teacher_msgs, teacher_summary
 
-def analyze_patterns(
-    data: Dict[str, Dict[str, Dict[int, Optional[str]]]],
+
+def _analyze_patterns_python(
+    timetable: Timetable,
     consecutive_len: int,
-    target_periods: List[int],
+    target_periods: Sequence[int],
+    target_bits: int,
     min_days: int,
     check_period7: bool,
 ) -> Tuple[Dict[str, List[str]], Dict]:
     messages: Dict[str, List[str]] = {}
     summary: Dict[str, Dict] = {}
+    class_codes = timetable.class_codes
+    span = consecutive_len - 1
 
-    for teacher, day_map in data.items():
-        teacher_msgs: List[str] = []
-        teacher_summary = {
-            "patternA": [],
-            "patternB": {"triggered": False, "days": []},
-            "patternC": {"triggered": False, "days": []},
-        }
-
+    for teacher, week, day_masks in zip(timetable.teachers, timetable.codes, timetable.day_masks):
         # Pattern A
-        seen_a = set()
-        for day in DAYS_ORDER:
-            periods = day_map.get(day, {})
-            max_start = 7 - consecutive_len + 1
-            for start in range(1, max_start + 1):
-                window = [periods.get(p) for p in range(start, start + consecutive_len)]
-                if any(code is None for code in window):
+        pattern_a: List[Tuple[str, int, str]] = []
+        if consecutive_len >= 1:
+            for day, periods, mask in zip(DAYS_ORDER, week, day_masks):
+                if not mask:
                     continue
-                if len(set(window)) == 1:
-                    class_code = window[0]
-                    key = (day, start, start + consecutive_len - 1, class_code)
-                    if key in seen_a:
-                        continue
-                    seen_a.add(key)
-                    class_text = format_class_code(class_code)
-                    teacher_msgs.append(
-                        f"이 시간표는 {teacher} 선생님이 {day}요일에 {start}~{start + consecutive_len - 1}교시 연속 {class_text}입니다."
-                    )
-                    teacher_summary["patternA"].append(
-                        {
-                            "day": day,
-                            "start": start,
-                            "end": start + consecutive_len - 1,
-                            "class_code": class_code,
-                        }
-                    )
-
-        # Pattern B
-        matched_days = []
-        for day in DAYS_ORDER:
-            periods = day_map.get(day, {})
-            if all(periods.get(p) is not None for p in target_periods):
-                matched_days.append(day)
-        if len(matched_days) >= min_days:
-            days_text = ",".join(matched_days)
-            periods_text = ",".join(str(p) for p in target_periods)
-            teacher_msgs.append(
-                f"이 시간표는 {teacher} 선생님이 {len(DAYS_ORDER)}일 중 {min_days}일 이상 ({periods_text})교시에 수업이 있는 시간표입니다. (해당 요일: {days_text})"
-            )
-            teacher_summary["patternB"] = {"triggered": True, "days": matched_days}
-
-        # Pattern C
-        if check_period7:
-            matched_days = []
-            for day in DAYS_ORDER:
-                periods = day_map.get(day, {})
-                if periods.get(7) is not None:
-                    matched_days.append(day)
-            if len(matched_days) >= min_days:
-                days_text = ",".join(matched_days)
-                teacher_msgs.append(
-                    f"이 시간표는 {teacher} 선생님이 {len(DAYS_ORDER)}일 중 {min_days}일 이상 7교시에 수업이 있는 시간표입니다. (해당 요일: {days_text})"
-                )
-                teacher_summary["patternC"] = {"triggered": True, "days": matched_days}
-
+                # 같은 학급이 이어지는 길이(run)를 한 번에 훑으며, 길이가 충분하면
+                # 현재 교시에서 끝나는 구간을 기록한다.
+                prev, run = NO_CLASS, 0
+                for period, code in enumerate(periods, start=1):
+                    if code == NO_CLASS:
+                        run = 0
+                    elif code == prev:
+                        run += 1
+                    else:
+                        run = 1
+                    prev = code
+                    if run >= consecutive_len:
+                        pattern_a.append((day, period - span, class_codes[code]))
+
+        # Pattern B, C: 요일 마스크를 한 번만 훑으며 두 조건을 함께 확인한다.
+        b_days: List[str] = []
+        c_days: List[str] = []
+        for day, mask in zip(DAYS_ORDER, day_masks):
+            if (mask & target_bits) == target_bits:
+                b_days.append(day)
+            if mask & PERIOD7_BIT:
+                c_days.append(day)
+        pattern_b_days = b_days if len(b_days) >= min_days else None
+        pattern_c_days = c_days if check_period7 and len(c_days) >= min_days else None
+
+        teacher_msgs, summary[teacher] = _build_teacher_result(
+            teacher, pattern_a, pattern_b_days, pattern_c_days, consecutive_len, target_periods, min_days
+        )
         if teacher_msgs:
             messages[teacher] = teacher_msgs
-        summary[teacher] = teacher_summary
 
     return messages, summary
 
 
-def format_report(messages: Dict[str, List[str]]) -> str:
+def analyze_patterns(
+    timetable: Timetable,
+    consecutive_len: int,
+    target_periods: Sequence[int],
+    min_days: int,
+    check_period7: bool,
+) -> Tuple[Dict[str, List[str]], Dict]:
+    target_periods = tuple(target_periods)
+    target_bits = _target_bits(target_periods)
+    return _analyze_patterns_python(
+        timetable, consecutive_len, target_periods, target_bits, min_days, check_period7
+    )
+
+
+def iter_report_blocks(messages: Dict[str, List[str]]) -> Iterator[str]:
     if not messages:
-        return "문제 패턴이 발견되지 않았습니다."
+        yield "문제 패턴이 발견되지 않았습니다."
+        return
 
-    lines: List[str] = []
     for teacher in sorted(messages.keys()):
-        lines.append(f"=== {teacher} 선생님 ===")
-        for msg in messages[teacher]:
-            lines.append(f"- {msg}")
-    return "\n".join(lines)
+        lines = [f"=== {teacher} 선생님 ==="]
+        lines.extend(f"- {msg}" for msg in messages[teacher])
+        yield "\n".join(lines)
+
+
+def format_report(messages: Dict[str, List[str]]) -> str:
+    return "\n".join(iter_report_blocks(messages))
+
+
+@functools.lru_cache(maxsize=32)
+def parse_int_list(value: str) -> Tuple[int, ...]:
+    return tuple(int(p) for p in value.split(",") if p.strip())
 
 
 def write_text_output(text: str, output_path: Optional[str]):
@@ -218,18 +332,26 @@ def write_text_output(text: str, output_path: Optional[str]):
         print(text)
 
 
+def iter_json_summary(summary: Dict) -> Iterator[str]:
+    encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+    return encoder.iterencode({"teachers": summary})
+
+
 def write_json_output(summary: Dict, json_path: Optional[str]):
-    payload = {"teachers": summary}
+    chunks = iter_json_summary(summary)
     if json_path:
         with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+            f.writelines(chunks)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        sys.stdout.writelines(chunks)
+        sys.stdout.write("\n")
 
 
 class FakeWorksheet:
-    def __init__(self, data: List[List[Optional[str]]]):
+    def __init__(self, data: List[List[Optional[str]]], pad_rows: bool = True):
         self._data = data
+        # pad_rows=False면 dimension을 지운 read-only 시트처럼 행을 실제 길이대로 돌려준다.
+        self._pad_rows = pad_rows
         self.max_row = len(data)
         self.max_column = max((len(row) for row in data), default=0)
 
@@ -244,6 +366,20 @@ class FakeWorksheet:
             value = None
         return Cell(value)
 
+    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None, values_only=False):
+        min_row = min_row or 1
+        max_row = max_row or self.max_row
+        min_col = min_col or 1
+        max_col = max_col or self.max_column
+        for row in range(min_row, max_row + 1):
+            if not self._pad_rows:
+                max_col = len(self._data[row - 1])
+            cells = tuple(self.cell(row=row, column=col) for col in range(min_col, max_col + 1))
+            if values_only:
+                yield tuple(cell.value for cell in cells)
+            else:
+                yield cells
+
 
 def build_sample_sheet_for_tests() -> FakeWorksheet:
     data = [[None] * 36 for _ in range(6)]
@@ -252,23 +388,23 @@ def build_sample_sheet_for_tests() -> FakeWorksheet:
     for idx, day in enumerate(DAYS_ORDER):
         data[1][1 + idx * 7] = day
     # Row 3: period numbers
-    for idx in range(len(DAYS_ORDER)):
+    for idx in range(_NUM_DAYS):
         for p in range(7):
             data[2][1 + idx * 7 + p] = p + 1
     # Row 4: teacher name
     data[3][0] = "홍길동(1)"
-    # Pattern A: 수요일 1~4교시 101
-    wed_start = 1 + DAYS_ORDER.index("수") * 7
-    for p in range(4):
-        data[3][wed_start + p] = "101\n국어"
     # Pattern B: 월수금 1,4,5,7
     for day in ["월", "수", "금"]:
-        start = 1 + DAYS_ORDER.index(day) * 7
+        start = 1 + DAYS_IDX[day] * 7
         for p in [1, 4, 5, 7]:
             data[3][start + p - 1] = "203\n수학"
+    # Pattern A: 수요일 1~4교시 101 (Pattern B의 수요일 1,4교시를 덮어쓴다)
+    wed_start = 1 + DAYS_IDX["수"] * 7
+    for p in range(4):
+        data[3][wed_start + p] = "101\n국어"
     # Pattern C: 화목금 7교시
     for day in ["화", "목", "금"]:
-        start = 1 + DAYS_ORDER.index(day) * 7
+        start = 1 + DAYS_IDX[day] * 7
         data[3][start + 6] = "305\n영어"
     return FakeWorksheet(data)
 
@@ -291,6 +427,25 @@ def run_self_tests():
     assert "7교시에 수업" in report
     assert summary["홍길동"]["patternA"], "Pattern A 요약 누락"
 
+    # read-only 시트는 행 길이가 요일 블록보다 짧거나 아예 빈 튜플일 수 있다.
+    rows = build_sample_sheet_for_tests()._data[:3]
+    rows += [["김철수", "101\n국어", "101\n국어"], [], ["이영희"]]
+    short_sheet = FakeWorksheet(rows, pad_rows=False)
+    short = parse_teacher_rows(short_sheet, detect_day_blocks(short_sheet))
+    assert short.teachers == ["김철수", "이영희"], "짧은 행의 교사 인식 실패"
+    assert short.class_codes == ["101"]
+    assert short.codes[0][0] == [0, 0] + [NO_CLASS] * 5
+    assert short.codes[1] == [[NO_CLASS] * 7 for _ in DAYS_ORDER]
+    assert short.day_masks == [[0b11, 0, 0, 0, 0], [0] * _NUM_DAYS]
+
+    # A열 공백이 _MAX_BLANK_ROWS 미만이면 다음 교사를 읽고, 그 이상이면 읽기를 멈춘다.
+    rows = build_sample_sheet_for_tests()._data[:3]
+    rows += [["김철수"]] + [[]] * (_MAX_BLANK_ROWS - 1)
+    rows += [["이영희"]] + [[]] * _MAX_BLANK_ROWS + [["박민수"]]
+    gap_sheet = FakeWorksheet(rows, pad_rows=False)
+    gapped = parse_teacher_rows(gap_sheet, detect_day_blocks(gap_sheet))
+    assert gapped.teachers == ["김철수", "이영희"], "빈 행 이후 교사 처리 오류"
+
 
 def run_gui():
     import tkinter as tk
@@ -304,9 +459,19 @@ def run_gui():
         if path:
             file_var.set(path)
 
-    def parse_int_list(value: str) -> List[int]:
-        parts = [p.strip() for p in value.split(",") if p.strip()]
-        return [int(p) for p in parts]
+    def insert_chunks(chunks: Iterable[str], flush_size: int = 8192):
+        # Text.insert는 호출마다 Tcl을 거치므로 작은 조각은 모아서 넣는다.
+        buffer: List[str] = []
+        size = 0
+        for chunk in chunks:
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= flush_size:
+                output_text.insert(tk.END, "".join(buffer))
+                buffer.clear()
+                size = 0
+        if buffer:
+            output_text.insert(tk.END, "".join(buffer))
 
     def run_check():
         file_path = file_var.get().strip()
@@ -325,8 +490,11 @@ def run_gui():
 
         try:
             sheet = load_sheet(file_path)
-            day_blocks = detect_day_blocks(sheet)
-            data = parse_teacher_rows(sheet, day_blocks)
+            try:
+                day_blocks = detect_day_blocks(sheet)
+                data = parse_teacher_rows(sheet, day_blocks)
+            finally:
+                sheet.parent.close()
             messages, summary = analyze_patterns(
                 data,
                 consecutive_len=consecutive_len,
@@ -334,14 +502,15 @@ def run_gui():
                 min_days=min_days,
                 check_period7=check_period7,
             )
-            report = format_report(messages)
             output_text.delete("1.0", tk.END)
-            output_text.insert(tk.END, report)
+            for idx, block in enumerate(iter_report_blocks(messages)):
+                if idx:
+                    output_text.insert(tk.END, "\n")
+                output_text.insert(tk.END, block)
 
             if json_var.get():
-                json_report = json.dumps({"teachers": summary}, ensure_ascii=False, indent=2)
                 output_text.insert(tk.END, "\n\n[JSON 요약]\n")
-                output_text.insert(tk.END, json_report)
+                insert_chunks(iter_json_summary(summary))
         except ParseError as exc:
             messagebox.showerror("파싱 오류", f"파일 형식을 해석할 수 없습니다: {exc}")
         except Exception as exc: